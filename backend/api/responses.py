@@ -0,0 +1,39 @@
+"""
+Custom response classes
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.requests import ClientDisconnect
+from starlette.types import Receive, Scope, Send
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson (handles NumPy scalars natively)"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """
+    Streaming response whose body iterator reads the request body itself
+
+    StreamingResponse normally listens for client disconnects by consuming
+    ``receive()``, which would swallow request body chunks still being
+    uploaded. Here the iterator owns ``receive()`` and sees the disconnect
+    through ``request.stream()`` instead, which raises ClientDisconnect.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        except (OSError, ClientDisconnect):
+            # Client went away mid-stream; nothing left to send
+            return
+        if self.background is not None:
+            await self.background()
@@ -2,7 +2,8 @@
 API route handlers
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from starlette.concurrency import run_in_threadpool
 from models.request import CustomerData, BatchPredictionRequest
 from models.response import (
     PredictionResponse,
@@ -12,11 +13,14 @@ from models.response import (
     RootResponse,
 )
 from services.prediction import prediction_service
+from services.batching import batcher
+from api.responses import DuplexStreamingResponse, ORJSONResponse
+from api.routing import ORJSONRoute
 from core.model_loader import model_manager
 from core.config import APP_TITLE, APP_VERSION
 
-# Create router
-router = APIRouter()
+# Create router (request bodies parsed with orjson)
+router = APIRouter(route_class=ORJSONRoute)
 
 
 @router.get("/", response_model=RootResponse)
@@ -29,6 +33,7 @@ async def root():
         endpoints={
             "POST /predict": "Single customer prediction",
             "POST /predict/batch": "Batch prediction for multiple customers",
+            "POST /predict/batch/stream": "Streaming NDJSON batch prediction",
             "GET /model/info": "Get model information",
             "GET /health": "Health check",
         },
@@ -48,23 +53,22 @@ async def health_check():
 @router.get("/model/info", response_model=ModelInfo)
 async def get_model_info():
     """Get model performance metrics and metadata"""
-    try:
-        metadata = model_manager.model_metadata
-        return ModelInfo(
-            model_name=metadata["model_name"],
-            f1_score=metadata["f1_score"],
-            accuracy=metadata["accuracy"],
-            precision=metadata["precision"],
-            recall=metadata["recall"],
-            roc_auc=metadata["roc_auc"],
-            n_features=metadata["n_features"],
-            training_date=metadata["training_date"],
-        )
-    except RuntimeError as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    metadata = model_manager.model_metadata
+    return ModelInfo(
+        model_name=metadata["model_name"],
+        f1_score=metadata["f1_score"],
+        accuracy=metadata["accuracy"],
+        precision=metadata["precision"],
+        recall=metadata["recall"],
+        roc_auc=metadata["roc_auc"],
+        n_features=metadata["n_features"],
+        training_date=metadata["training_date"],
+    )
 
 
-@router.post("/predict", response_model=PredictionResponse)
+@router.post(
+    "/predict", response_model=PredictionResponse, response_class=ORJSONResponse
+)
 async def predict_churn(customer: CustomerData):
     """
     Predict churn for a single customer
@@ -76,12 +80,17 @@ async def predict_churn(customer: CustomerData):
         Prediction results with churn probability and risk level
     """
     try:
-        return prediction_service.predict_single(customer)
+        prediction = await batcher.submit(customer)
+        return ORJSONResponse(content=prediction)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Prediction error: {str(e)}")
 
 
-@router.post("/predict/batch", response_model=BatchPredictionResponse)
+@router.post(
+    "/predict/batch",
+    response_model=BatchPredictionResponse,
+    response_class=ORJSONResponse,
+)
 async def predict_churn_batch(request: BatchPredictionRequest):
     """
     Predict churn for multiple customers
@@ -93,9 +102,28 @@ async def predict_churn_batch(request: BatchPredictionRequest):
         Batch prediction results with statistics
     """
     try:
-        return prediction_service.predict_batch(request.customers)
+        # Run CPU-bound inference off the event loop
+        result = await run_in_threadpool(
+            prediction_service.predict_batch, request.customers
+        )
+        return ORJSONResponse(content=result)
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Batch prediction error: {str(e)}"
         )
 
+
+@router.post("/predict/batch/stream")
+async def predict_churn_stream(request: Request):
+    """
+    Predict churn for an NDJSON stream of customers
+
+    Args:
+        request: Request whose body has one customer JSON object per line
+
+    Returns:
+        NDJSON stream with one prediction (or error) per input line
+    """
+    return DuplexStreamingResponse(
+        batcher.stream(request.stream()), media_type="application/x-ndjson"
+    )
@@ -19,6 +19,47 @@ ALLOW_HEADERS = ["*"]
 # Model settings
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 MODELS_DIR = PROJECT_ROOT / "models"
+ONNX_MODEL_PATH = MODELS_DIR / "xgboost_model.onnx"
+ONNX_INPUT_NAME = "input"
+TREELITE_LIB_PATH = MODELS_DIR / "xgboost_model.so"
+PREPROCESSING_PATH = MODELS_DIR / "preprocessing.npz"
+
+# Inference backend: "onnx" (ONNX Runtime) or "treelite" (compiled library)
+MODEL_BACKEND = os.getenv("MODEL_BACKEND", "onnx")
+
+# Inference runtime settings (one thread per worker process)
+ORT_INTRA_OP_THREADS = 1
+ORT_INTER_OP_THREADS = 1
+
+# Server settings
+WORKERS = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+
+# Batches with at least MIN_PARALLEL uncached customers are scored in
+# shards of at least MIN_PARALLEL rows on up to BATCH_THREADS threads.
+# Off by default: WORKERS already uses every core, so extra threads per
+# worker only oversubscribe the CPU. Enable for single-worker deployments.
+MIN_PARALLEL = 64
+BATCH_THREADS = int(os.getenv("BATCH_THREADS", 1))
+
+# Micro-batching of /predict requests
+MAX_BATCH = 32
+MAX_WAIT_MS = 5
+
+# Maximum in-flight predictions per /predict/batch/stream request
+STREAM_MAX_PENDING = 256
+
+# Longer /predict/batch/stream lines are rejected (a customer is ~600 bytes)
+STREAM_MAX_LINE_BYTES = 16 * 1024
+
+# Number of customer predictions kept in the in-memory LRU cache
+PREDICTION_CACHE_SIZE = 10000
+
+# Startup warmup: single predictions and one batch of this size
+WARMUP_RUNS = 5
+WARMUP_BATCH_SIZE = 32
+
+# Decision threshold on churn probability
+CHURN_THRESHOLD = 0.5
 
 # Risk level thresholds
 RISK_THRESHOLD_LOW = 0.3
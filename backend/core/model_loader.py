@@ -3,21 +3,50 @@ Model loading and management
 """
 
 import pickle
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
-from core.config import MODELS_DIR
+import numpy as np
+import onnxruntime as ort
+
+from core.config import (
+    MODELS_DIR,
+    MODEL_BACKEND,
+    ONNX_MODEL_PATH,
+    ORT_INTER_OP_THREADS,
+    ORT_INTRA_OP_THREADS,
+    PREPROCESSING_PATH,
+    TREELITE_LIB_PATH,
+)
 
 
 class ModelManager:
-    """Singleton class to manage ML model artifacts"""
+    """
+    Singleton class to manage ML model artifacts
+
+    Artifacts are plain attributes assigned once by load_artifacts() at
+    startup; the request path reads them directly without load checks.
+
+    Single-row inference goes through the preallocated input_buffer: hold
+    input_lock while writing the row into it and calling predict_proba_one().
+    """
 
     _instance: Optional["ModelManager"] = None
-    _model: Any = None
-    _scaler: Any = None
-    _label_encoders: Dict[str, Any] = None
-    _feature_names: list = None
-    _model_metadata: Dict[str, Any] = None
+    session: Optional[ort.InferenceSession] = None
+    predictor: Any = None
+    _dmatrix: Any = None
+    _input_name: str = None
+    _prob_output_name: str = None
+    input_buffer: Optional[np.ndarray] = None
+    input_lock = threading.Lock()
+    _output_buffer: Optional[np.ndarray] = None
+    _io_binding: Optional[ort.IOBinding] = None
+    category_encoders: Dict[str, Callable[[str], int]] = None
+    scaler_mean: Optional[np.ndarray] = None
+    scaler_inv_scale: Optional[np.ndarray] = None
+    feature_names: list = None
+    model_metadata: Dict[str, Any] = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -25,66 +54,141 @@ class ModelManager:
         return cls._instance
 
     def load_artifacts(self) -> None:
-        """Load all model artifacts from pickle files"""
+        """Load the compiled model and the preprocessing artifacts"""
         try:
-            with open(MODELS_DIR / "xgboost_model.pkl", "rb") as f:
-                self._model = pickle.load(f)
-
-            with open(MODELS_DIR / "scaler.pkl", "rb") as f:
-                self._scaler = pickle.load(f)
-
-            with open(MODELS_DIR / "label_encoders.pkl", "rb") as f:
-                self._label_encoders = pickle.load(f)
-
-            with open(MODELS_DIR / "feature_names.pkl", "rb") as f:
-                self._feature_names = pickle.load(f)
+            self._load_model()
+
+            # Plain arrays exported by scripts.export_model; loading them
+            # avoids importing scikit-learn to unpickle the scaler/encoders
+            with np.load(PREPROCESSING_PATH) as arrays:
+                self.feature_names = arrays["feature_names"].tolist()
+                scaler_mean = arrays["scaler_mean"]
+                scaler_scale = arrays["scaler_scale"]
+                classes = {
+                    name.split(":", 1)[1]: arrays[name].tolist()
+                    for name in arrays.files
+                    if name.startswith("classes:")
+                }
+
+            # Per-column bound dict lookups instead of LabelEncoder.transform
+            self.category_encoders = {
+                col: {cls: i for i, cls in enumerate(col_classes)}.__getitem__
+                for col, col_classes in classes.items()
+            }
+            self.scaler_mean = scaler_mean.astype(np.float64)
+            self.scaler_inv_scale = 1.0 / scaler_scale.astype(np.float64)
+
+            self._validate_artifacts()
+
+            self.input_buffer = np.empty(
+                (1, len(self.feature_names)), dtype=np.float32
+            )
+            if self.session is not None:
+                self._bind_single_row()
 
             with open(MODELS_DIR / "model_metadata.pkl", "rb") as f:
-                self._model_metadata = pickle.load(f)
+                self.model_metadata = pickle.load(f)
 
             print("✓ All model artifacts loaded successfully")
         except Exception as e:
             print(f"Error loading model artifacts: {e}")
             raise
 
-    @property
-    def model(self):
-        """Get the loaded model"""
-        if self._model is None:
-            raise RuntimeError("Model not loaded. Call load_artifacts() first.")
-        return self._model
-
-    @property
-    def scaler(self):
-        """Get the loaded scaler"""
-        if self._scaler is None:
-            raise RuntimeError("Scaler not loaded. Call load_artifacts() first.")
-        return self._scaler
-
-    @property
-    def label_encoders(self):
-        """Get the loaded label encoders"""
-        if self._label_encoders is None:
-            raise RuntimeError("Label encoders not loaded. Call load_artifacts() first.")
-        return self._label_encoders
-
-    @property
-    def feature_names(self):
-        """Get the feature names"""
-        if self._feature_names is None:
-            raise RuntimeError("Feature names not loaded. Call load_artifacts() first.")
-        return self._feature_names
-
-    @property
-    def model_metadata(self):
-        """Get the model metadata"""
-        if self._model_metadata is None:
-            raise RuntimeError("Model metadata not loaded. Call load_artifacts() first.")
-        return self._model_metadata
+    def _load_model(self) -> None:
+        """Load the configured model backend"""
+        if MODEL_BACKEND == "treelite":
+            import tl2cgen
+
+            self.predictor = tl2cgen.Predictor(str(TREELITE_LIB_PATH), nthread=1)
+            self._dmatrix = tl2cgen.DMatrix
+        else:
+            self.session = self._create_session(ONNX_MODEL_PATH)
+            self._input_name = self.session.get_inputs()[0].name
+            self._prob_output_name = self.session.get_outputs()[1].name
+
+    def _validate_artifacts(self) -> None:
+        """Check that the model and scaler agree with the feature list"""
+        n_features = len(self.feature_names)
+
+        if self.predictor is not None:
+            model_features = self.predictor.num_feature
+        else:
+            model_features = self.session.get_inputs()[0].shape[1]
+        if model_features != n_features:
+            raise ValueError(
+                f"Model expects {model_features} features, "
+                f"feature list has {n_features}"
+            )
+
+        if len(self.scaler_mean) != n_features:
+            raise ValueError(
+                f"Scaler was fit on {len(self.scaler_mean)} features, "
+                f"feature list has {n_features}"
+            )
+
+    def _bind_single_row(self) -> None:
+        """Bind input_buffer and a preallocated output to the session"""
+        self._output_buffer = np.empty((1, 2), dtype=np.float32)
+        self._io_binding = self.session.io_binding()
+        # OrtValues created from NumPy arrays share their memory, so rows
+        # written into input_buffer are seen by the binding without a copy
+        self._io_binding.bind_ortvalue_input(
+            self._input_name, ort.OrtValue.ortvalue_from_numpy(self.input_buffer)
+        )
+        self._io_binding.bind_ortvalue_output(
+            self._prob_output_name,
+            ort.OrtValue.ortvalue_from_numpy(self._output_buffer),
+        )
+
+    @staticmethod
+    def _create_session(path: Path) -> ort.InferenceSession:
+        """Create a single-threaded CPU inference session"""
+        sess_options = ort.SessionOptions()
+        sess_options.intra_op_num_threads = ORT_INTRA_OP_THREADS
+        sess_options.inter_op_num_threads = ORT_INTER_OP_THREADS
+        sess_options.graph_optimization_level = (
+            ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        )
+        sess_options.enable_mem_pattern = True
+        sess_options.enable_cpu_mem_arena = True
+        return ort.InferenceSession(
+            str(path), sess_options, providers=["CPUExecutionProvider"]
+        )
+
+    def predict_proba(self, features: np.ndarray) -> np.ndarray:
+        """
+        Run the model on a float32 feature matrix
+
+        Args:
+            features: Scaled features of shape (n_samples, n_features)
+
+        Returns:
+            Churn probability for each sample, shape (n_samples,)
+        """
+        if self.predictor is not None:
+            return self.predictor.predict(self._dmatrix(features)).reshape(-1)
+
+        (probabilities,) = self.session.run(
+            [self._prob_output_name], {self._input_name: features}
+        )
+        return probabilities[:, 1]
+
+    def predict_proba_one(self) -> float:
+        """
+        Run the model on the row currently held in input_buffer
+
+        Returns:
+            Churn probability for that row
+        """
+        if self._io_binding is None:
+            return float(self.predict_proba(self.input_buffer)[0])
+
+        self.session.run_with_iobinding(self._io_binding)
+        return float(self._output_buffer[0, 1])
 
     def is_loaded(self) -> bool:
         """Check if model artifacts are loaded"""
-        return self._model is not None
+        return self.session is not None or self.predictor is not None
 
 
 # Create singleton instance
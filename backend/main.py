@@ -3,9 +3,15 @@ FastAPI application for Customer Churn Prediction
 Entry point for the application
 """
 
+import os
 import sys
 from pathlib import Path
 
+# Keep native thread pools single-threaded; throughput comes from running
+# several worker processes instead. Must be set before the inference
+# runtimes are imported.
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -20,15 +26,20 @@ from core.config import (
     ALLOW_CREDENTIALS,
     ALLOW_METHODS,
     ALLOW_HEADERS,
+    WORKERS,
 )
 from core.model_loader import model_manager
+from services.batching import batcher
+from services.prediction import prediction_service
 from api.routes import router
+from api.responses import ORJSONResponse
 
 # Initialize FastAPI app
 app = FastAPI(
     title=APP_TITLE,
     description=APP_DESCRIPTION,
     version=APP_VERSION,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -49,16 +60,25 @@ async def startup_event():
     """Load model artifacts on application startup"""
     print("🚀 Starting Customer Churn Prediction API...")
     model_manager.load_artifacts()
+
+    timings = prediction_service.warmup()
+    print(
+        "✓ Warmup complete: "
+        + ", ".join(f"{step} {ms:.2f}ms" for step, ms in timings.items())
+    )
+
+    batcher.start()
     print("✅ Application ready!")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on application shutdown"""
+    await batcher.stop()
     print("👋 Shutting down Customer Churn Prediction API...")
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("backend.main:app", host="0.0.0.0", port=8000)
+    uvicorn.run("backend.main:app", host="0.0.0.0", port=8000, workers=WORKERS)
@@ -3,12 +3,41 @@ Request models for API endpoints
 """
 
 from typing import List
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class CustomerData(BaseModel):
     """Input data for customer churn prediction"""
 
+    model_config = ConfigDict(
+        # Strip string fields in pydantic-core instead of a Python validator
+        str_strip_whitespace=True,
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "gender": "Male",
+                "SeniorCitizen": 0,
+                "Partner": "Yes",
+                "Dependents": "No",
+                "tenure": 12,
+                "PhoneService": "Yes",
+                "MultipleLines": "No",
+                "InternetService": "Fiber optic",
+                "OnlineSecurity": "No",
+                "OnlineBackup": "Yes",
+                "DeviceProtection": "No",
+                "TechSupport": "No",
+                "StreamingTV": "Yes",
+                "StreamingMovies": "Yes",
+                "Contract": "Month-to-month",
+                "PaperlessBilling": "Yes",
+                "PaymentMethod": "Electronic check",
+                "MonthlyCharges": 85.50,
+                "TotalCharges": 1026.00,
+            }
+        },
+    )
+
     gender: str = Field(..., description="Customer gender (Male/Female)")
     SeniorCitizen: int = Field(
         ..., description="Whether customer is senior citizen (0/1)"
@@ -62,14 +91,6 @@ class CustomerData(BaseModel):
     MonthlyCharges: float = Field(..., description="Monthly charges amount", ge=0)
     TotalCharges: float = Field(..., description="Total charges amount", ge=0)
 
-    @field_validator('gender', 'Partner', 'Dependents', 'PhoneService', 'MultipleLines', 'InternetService', 'OnlineSecurity', 'OnlineBackup', 'DeviceProtection', 'TechSupport', 'StreamingTV', 'StreamingMovies', 'Contract', 'PaperlessBilling', 'PaymentMethod', mode='before')
-    @classmethod
-    def strip_strings(cls, v):
-        """Strip whitespace from string fields"""
-        if isinstance(v, str):
-            return v.strip()
-        return v
-
     @field_validator('MonthlyCharges', 'TotalCharges', mode='before')
     @classmethod
     def parse_charges(cls, v):
@@ -84,30 +105,9 @@ class CustomerData(BaseModel):
                 raise ValueError(f"Invalid float value: {v}")
         return v
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "gender": "Male",
-                "SeniorCitizen": 0,
-                "Partner": "Yes",
-                "Dependents": "No",
-                "tenure": 12,
-                "PhoneService": "Yes",
-                "MultipleLines": "No",
-                "InternetService": "Fiber optic",
-                "OnlineSecurity": "No",
-                "OnlineBackup": "Yes",
-                "DeviceProtection": "No",
-                "TechSupport": "No",
-                "StreamingTV": "Yes",
-                "StreamingMovies": "Yes",
-                "Contract": "Month-to-month",
-                "PaperlessBilling": "Yes",
-                "PaymentMethod": "Electronic check",
-                "MonthlyCharges": 85.50,
-                "TotalCharges": 1026.00,
-            }
-        }
+    def cache_key(self) -> tuple:
+        """Hashable key built from the validated field values"""
+        return tuple(self.__dict__.values())
 
 
 class BatchPredictionRequest(BaseModel):
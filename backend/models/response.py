@@ -3,19 +3,14 @@ Response models for API endpoints
 """
 
 from typing import List, Dict
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PredictionResponse(BaseModel):
     """Response model for prediction"""
 
-    churn_prediction: int = Field(..., description="Predicted churn (0=No, 1=Yes)")
-    churn_probability: float = Field(..., description="Probability of churn")
-    churn_label: str = Field(..., description="Churn label (No Churn/Churn)")
-    risk_level: str = Field(..., description="Risk level (Low/Medium/High)")
-
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "churn_prediction": 1,
                 "churn_probability": 0.78,
@@ -23,6 +18,12 @@ class PredictionResponse(BaseModel):
                 "risk_level": "High",
             }
         }
+    )
+
+    churn_prediction: int = Field(..., description="Predicted churn (0=No, 1=Yes)")
+    churn_probability: float = Field(..., description="Probability of churn")
+    churn_label: str = Field(..., description="Churn label (No Churn/Churn)")
+    risk_level: str = Field(..., description="Risk level (Low/Medium/High)")
 
 
 class BatchPredictionResponse(BaseModel):
@@ -0,0 +1,3 @@
+"""
+Offline scripts for preparing model artifacts
+"""
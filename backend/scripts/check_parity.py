@@ -0,0 +1,139 @@
+"""
+Check the serving feature pipeline against the training-style transform
+
+Run from the backend directory:
+
+    python -m scripts.check_parity
+
+Every row of the dataset is preprocessed twice: once with preprocess_many
+(the Numba kernel used by the API) and once with the pandas feature
+engineering, LabelEncoders and StandardScaler from the training notebook.
+Both feature matrices are scored with the served model; the script exits
+non-zero if features or probabilities differ by more than the tolerances.
+"""
+
+import pickle
+import sys
+from pathlib import Path
+
+# Add backend and the project root (models/__init__.py imports backend.*) to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from core.config import MODELS_DIR, PROJECT_ROOT
+from core.model_loader import model_manager
+from models.request import CustomerData
+from services.kernels import INPUT_CATEGORICAL_COLS
+from services.preprocessing import preprocess_many
+
+DATASET_PATH = PROJECT_ROOT / "data" / "IT_customer_churn.csv"
+
+# Both paths end in float32; allow a few float32 ulps on the scaled values
+FEATURE_TOLERANCE = 1e-5
+PROBABILITY_TOLERANCE = 1e-6
+
+
+def load_customers() -> pd.DataFrame:
+    """Load the dataset as validated API inputs"""
+    df = pd.read_csv(DATASET_PATH, dtype=str, keep_default_na=False)
+    df = df.drop(columns=["Churn"])
+    customers = [CustomerData(**row) for row in df.to_dict("records")]
+    return pd.DataFrame([customer.model_dump() for customer in customers])
+
+
+def reference_features(df: pd.DataFrame) -> np.ndarray:
+    """Training-style pandas/sklearn transform of the raw input columns"""
+    with open(MODELS_DIR / "scaler.pkl", "rb") as f:
+        scaler = pickle.load(f)
+    with open(MODELS_DIR / "label_encoders.pkl", "rb") as f:
+        label_encoders = pickle.load(f)
+    with open(MODELS_DIR / "feature_names.pkl", "rb") as f:
+        feature_names = pickle.load(f)
+
+    df = df.copy()
+    yes_no = {True: "Yes", False: "No"}
+
+    df["ServiceCount"] = (
+        (df["PhoneService"] == "Yes").astype(int)
+        + (df["InternetService"] != "No").astype(int)
+        + sum(
+            (df[col] == "Yes").astype(int)
+            for col in (
+                "OnlineSecurity",
+                "OnlineBackup",
+                "DeviceProtection",
+                "TechSupport",
+                "StreamingTV",
+                "StreamingMovies",
+            )
+        )
+    )
+    df["AvgMonthlyRate"] = df["TotalCharges"] / df["tenure"].replace(0, 1)
+    df["PremiumServiceCount"] = sum(
+        (df[col] == "Yes").astype(int)
+        for col in ("OnlineSecurity", "OnlineBackup", "DeviceProtection", "TechSupport")
+    )
+    df["HasPremiumServices"] = (df["PremiumServiceCount"] > 0).map(yes_no)
+    df["HasStreaming"] = (
+        (df["StreamingTV"] == "Yes") | (df["StreamingMovies"] == "Yes")
+    ).map(yes_no)
+    df["ValueSegment"] = pd.cut(
+        df["MonthlyCharges"],
+        bins=[0, 35, 70, 120],
+        labels=["Low Value", "Medium Value", "High Value"],
+    )
+    df["HighRiskProfile"] = (
+        (df["Contract"] == "Month-to-month")
+        & (df["PaymentMethod"] == "Electronic check")
+    ).map(yes_no)
+    df["FamilyCustomer"] = (
+        (df["Partner"] == "Yes") | (df["Dependents"] == "Yes")
+    ).map(yes_no)
+    df["Tenure_MonthlyCharges"] = df["tenure"] * df["MonthlyCharges"]
+    df["Tenure_ServiceCount"] = df["tenure"] * df["ServiceCount"]
+    df["MonthlyCharges_ServiceCount"] = df["MonthlyCharges"] * df["ServiceCount"]
+
+    encoded_cols = INPUT_CATEGORICAL_COLS + (
+        "HasPremiumServices",
+        "HasStreaming",
+        "HighRiskProfile",
+        "FamilyCustomer",
+        "ValueSegment",
+    )
+    for col in encoded_cols:
+        df[col] = label_encoders[col].transform(df[col].astype(str))
+
+    return scaler.transform(df[feature_names]).astype(np.float32)
+
+
+def main() -> int:
+    model_manager.load_artifacts()
+
+    df = load_customers()
+    customers = [CustomerData(**row) for row in df.to_dict("records")]
+
+    served = preprocess_many(customers)
+    reference = reference_features(df)
+
+    feature_diff = np.abs(served - reference).max()
+    probability_diff = np.abs(
+        model_manager.predict_proba(served) - model_manager.predict_proba(reference)
+    ).max()
+
+    print(f"Rows checked: {len(customers)}")
+    print(f"Max |feature diff|: {feature_diff:.3g}")
+    print(f"Max |probability diff|: {probability_diff:.3g}")
+
+    if feature_diff > FEATURE_TOLERANCE or probability_diff > PROBABILITY_TOLERANCE:
+        print("✗ Serving preprocessing diverges from the training transform")
+        return 1
+
+    print("✓ Serving preprocessing matches the training transform")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
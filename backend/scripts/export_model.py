@@ -0,0 +1,126 @@
+"""
+Export the trained XGBoost model for serving
+
+Run from the backend directory after training the model in churn.ipynb:
+
+    python -m scripts.export_model              # ONNX (default backend)
+    python -m scripts.export_model --treelite   # also compile a shared library
+
+Both also write the scaler and label encoder parameters as plain NumPy
+arrays, so the API can start without unpickling scikit-learn objects.
+
+The Treelite library is platform specific, so it is built on the deployment
+host rather than committed; select it with MODEL_BACKEND=treelite.
+"""
+
+import argparse
+import pickle
+import sys
+from pathlib import Path
+
+# Add backend to path for proper imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from core.config import (
+    MODELS_DIR,
+    ONNX_MODEL_PATH,
+    ONNX_INPUT_NAME,
+    PREPROCESSING_PATH,
+    TREELITE_LIB_PATH,
+)
+
+ONNX_TARGET_OPSET = 15
+
+
+def load_model():
+    """Load the pickled XGBClassifier produced by the notebook"""
+    with open(MODELS_DIR / "xgboost_model.pkl", "rb") as f:
+        return pickle.load(f)
+
+
+def export_onnx(model) -> None:
+    """Convert the XGBClassifier into an ONNX graph"""
+    from onnxmltools import convert_xgboost
+    from onnxmltools.convert.common.data_types import FloatTensorType
+
+    with open(MODELS_DIR / "feature_names.pkl", "rb") as f:
+        feature_names = pickle.load(f)
+
+    # The booster was trained on a named DataFrame; the ONNX converter only
+    # understands split features in the positional 'f%d' form.
+    booster = model.get_booster()
+    booster_feature_names = booster.feature_names
+    booster.feature_names = None
+    try:
+        onnx_model = convert_xgboost(
+            model,
+            initial_types=[
+                (ONNX_INPUT_NAME, FloatTensorType([None, len(feature_names)]))
+            ],
+            target_opset=ONNX_TARGET_OPSET,
+        )
+    finally:
+        booster.feature_names = booster_feature_names
+
+    with open(ONNX_MODEL_PATH, "wb") as f:
+        f.write(onnx_model.SerializeToString())
+
+    print(f"✓ ONNX model saved to {ONNX_MODEL_PATH}")
+
+
+def export_preprocessing() -> None:
+    """Save the scaler and label encoder parameters as NumPy arrays"""
+    with open(MODELS_DIR / "scaler.pkl", "rb") as f:
+        scaler = pickle.load(f)
+    with open(MODELS_DIR / "label_encoders.pkl", "rb") as f:
+        label_encoders = pickle.load(f)
+    with open(MODELS_DIR / "feature_names.pkl", "rb") as f:
+        feature_names = pickle.load(f)
+
+    classes = {
+        f"classes:{col}": np.asarray(encoder.classes_, dtype=str)
+        for col, encoder in label_encoders.items()
+    }
+    np.savez(
+        PREPROCESSING_PATH,
+        feature_names=np.asarray(feature_names, dtype=str),
+        scaler_mean=scaler.mean_,
+        scaler_scale=scaler.scale_,
+        **classes,
+    )
+
+    print(f"✓ Preprocessing parameters saved to {PREPROCESSING_PATH}")
+
+
+def export_treelite(model) -> None:
+    """Compile the booster ahead of time into a shared library"""
+    import tl2cgen
+    import treelite
+
+    tl_model = treelite.frontend.from_xgboost(model.get_booster())
+    tl2cgen.export_lib(
+        tl_model,
+        toolchain="gcc",
+        libpath=str(TREELITE_LIB_PATH),
+        params={"parallel_comp": 8},
+    )
+
+    print(f"✓ Treelite library saved to {TREELITE_LIB_PATH}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--treelite",
+        action="store_true",
+        help="also compile the model into a Treelite shared library",
+    )
+    args = parser.parse_args()
+
+    model = load_model()
+    export_onnx(model)
+    export_preprocessing()
+    if args.treelite:
+        export_treelite(model)
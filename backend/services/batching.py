@@ -0,0 +1,216 @@
+"""
+Micro-batching of single-customer prediction requests
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import orjson
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+
+from models.request import CustomerData
+from services.prediction import prediction_service
+from core.config import (
+    MAX_BATCH,
+    MAX_WAIT_MS,
+    STREAM_MAX_LINE_BYTES,
+    STREAM_MAX_PENDING,
+)
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent /predict calls into batched model runs
+
+    Requests are queued with a future each; a single background task
+    collects up to MAX_BATCH customers, scores them together and resolves the
+    futures. Batching is adaptive: a request that arrives alone is dispatched
+    immediately, and the task only waits (at most MAX_WAIT_MS) for more when
+    other requests were already queued behind it.
+    """
+
+    def __init__(self, max_batch: int = MAX_BATCH, max_wait_ms: float = MAX_WAIT_MS):
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the background batching task on the running event loop"""
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background batching task"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def submit(self, customer: CustomerData) -> Dict[str, Any]:
+        """
+        Queue a customer for prediction and wait for its result
+
+        Args:
+            customer: Customer data from API request
+
+        Returns:
+            Prediction dict (PredictionResponse fields) for this customer
+        """
+        if self._queue is None:
+            raise RuntimeError("Batcher not started. Call start() first.")
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((customer, future))
+        return await future
+
+    async def stream(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        """
+        Predict an NDJSON stream of customers line by line
+
+        Each non-empty line is validated and submitted to the batcher as soon
+        as it arrives; results are yielded as NDJSON in input order. At most
+        STREAM_MAX_PENDING predictions are in flight at once, so neither the
+        request nor the response is held in memory as a whole. Lines longer
+        than STREAM_MAX_LINE_BYTES get an error and are skipped unbuffered.
+
+        Args:
+            chunks: Raw request body chunks
+
+        Yields:
+            One JSON line per input line: a prediction, or {"error": ...}
+        """
+        pending: deque = deque()
+        remainder = b""
+        skipping = False
+        try:
+            async for chunk in chunks:
+                if skipping:
+                    # Discard the rest of an oversized line up to its newline
+                    end = chunk.find(b"\n")
+                    if end == -1:
+                        continue
+                    chunk = chunk[end + 1 :]
+                    skipping = False
+
+                *lines, remainder = (remainder + chunk).split(b"\n")
+                if len(remainder) > STREAM_MAX_LINE_BYTES:
+                    lines.append(remainder)
+                    remainder = b""
+                    skipping = True
+
+                for line in lines:
+                    if len(line) > STREAM_MAX_LINE_BYTES:
+                        pending.append(self._line_too_long())
+                    elif line.strip():
+                        task = asyncio.ensure_future(self._predict_line(line))
+                        pending.append(task)
+                    while pending and (
+                        pending[0].done() or len(pending) >= STREAM_MAX_PENDING
+                    ):
+                        yield await pending.popleft()
+
+            if remainder.strip():
+                pending.append(asyncio.ensure_future(self._predict_line(remainder)))
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    def _line_too_long() -> asyncio.Future:
+        """Resolved future holding the error line for an oversized input"""
+        future = asyncio.get_running_loop().create_future()
+        error = f"Line exceeds {STREAM_MAX_LINE_BYTES} bytes"
+        future.set_result(orjson.dumps({"error": error}) + b"\n")
+        return future
+
+    async def _predict_line(self, line: bytes) -> bytes:
+        """Validate one NDJSON line, predict it and serialize the result"""
+        try:
+            customer = CustomerData.model_validate_json(line)
+            result = await self.submit(customer)
+        except ValidationError as e:
+            errors = e.errors(
+                include_url=False, include_context=False, include_input=False
+            )
+            result = {"error": errors}
+        except Exception as e:
+            result = {"error": f"Prediction error: {str(e)}"}
+        return orjson.dumps(result) + b"\n"
+
+    async def _collect(self) -> List[Tuple[CustomerData, asyncio.Future]]:
+        """Wait for one request, then gather more if others are queued"""
+        batch = [await self._queue.get()]
+        self._drain(batch)
+        if len(batch) == 1:
+            # Nothing else queued: don't make a lone request wait
+            return batch
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+            self._drain(batch)
+
+        return batch
+
+    def _drain(self, batch: List[Tuple[CustomerData, asyncio.Future]]) -> None:
+        """Move already-queued requests into the batch without waiting"""
+        while len(batch) < self.max_batch and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+    async def _run(self) -> None:
+        """Background loop: collect, predict, fan results back out"""
+        while True:
+            batch = await self._collect()
+            customers = [customer for customer, _ in batch]
+            futures = [future for _, future in batch]
+
+            try:
+                results = await run_in_threadpool(
+                    prediction_service.predict_many, customers
+                )
+            except Exception:
+                # Isolate the failing customer(s) so the rest still succeed
+                await self._run_individually(batch)
+                continue
+
+            for future, result in zip(futures, results):
+                if not future.done():
+                    future.set_result(result)
+
+    @staticmethod
+    async def _run_individually(
+        batch: List[Tuple[CustomerData, asyncio.Future]],
+    ) -> None:
+        """Predict each queued customer on its own, failing only bad ones"""
+        for customer, future in batch:
+            try:
+                (result,) = await run_in_threadpool(
+                    prediction_service.predict_many, [customer]
+                )
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+
+# Create singleton instance
+batcher = MicroBatcher()
@@ -0,0 +1,92 @@
+"""
+In-memory cache of churn probabilities keyed by customer input
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Hashable, Iterable, List, Optional, Tuple
+
+from core.config import PREDICTION_CACHE_SIZE
+
+
+class PredictionCache:
+    """Thread-safe LRU cache mapping a customer key to its churn probability"""
+
+    def __init__(self, maxsize: int = PREDICTION_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[float]:
+        """
+        Look up a cached probability
+
+        Args:
+            key: Customer cache key
+
+        Returns:
+            Cached probability, or None on a miss
+        """
+        with self._lock:
+            probability = self._data.get(key)
+            if probability is not None:
+                self._data.move_to_end(key)
+            return probability
+
+    def put(self, key: Hashable, probability: float) -> None:
+        """
+        Store a probability, evicting the least recently used entry if full
+
+        Args:
+            key: Customer cache key
+            probability: Churn probability to cache
+        """
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = probability
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_many(self, keys: List[Hashable]) -> List[Optional[float]]:
+        """
+        Look up several probabilities under a single lock acquisition
+
+        Args:
+            keys: Customer cache keys
+
+        Returns:
+            Cached probability (or None) for each key, in order
+        """
+        with self._lock:
+            data = self._data
+            results = [data.get(key) for key in keys]
+            for key, probability in zip(keys, results):
+                if probability is not None:
+                    data.move_to_end(key)
+            return results
+
+    def put_many(self, items: Iterable[Tuple[Hashable, float]]) -> None:
+        """
+        Store several probabilities under a single lock acquisition
+
+        Args:
+            items: (key, probability) pairs
+        """
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            data = self._data
+            data.update(items)
+            while len(data) > self.maxsize:
+                data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        with self._lock:
+            self._data.clear()
+
+
+# Create singleton instance
+prediction_cache = PredictionCache()
@@ -0,0 +1,165 @@
+"""
+Numba kernels for feature engineering
+
+The kernels work on a raw float64 matrix whose columns follow RAW_COLS
+(categoricals already encoded to their integer codes) and write the full
+standard-scaled feature matrix in training feature order. Features are
+computed in float64 and scaled as they are stored, so the output array may
+be float32 without losing precision in the intermediate values. The kernels
+release the GIL, so shards of a batch can be processed on several threads.
+"""
+
+from numba import njit
+
+# Raw input layout
+INPUT_CATEGORICAL_COLS = (
+    "gender",
+    "Partner",
+    "Dependents",
+    "PhoneService",
+    "MultipleLines",
+    "InternetService",
+    "OnlineSecurity",
+    "OnlineBackup",
+    "DeviceProtection",
+    "TechSupport",
+    "StreamingTV",
+    "StreamingMovies",
+    "Contract",
+    "PaperlessBilling",
+    "PaymentMethod",
+)
+NUMERIC_COLS = ("SeniorCitizen", "tenure", "MonthlyCharges", "TotalCharges")
+RAW_COLS = INPUT_CATEGORICAL_COLS + NUMERIC_COLS
+
+# Features computed by the kernel, in the order of the positions array tail
+ENGINEERED_COLS = (
+    "ServiceCount",
+    "AvgMonthlyRate",
+    "PremiumServiceCount",
+    "HasPremiumServices",
+    "HasStreaming",
+    "ValueSegment",
+    "HighRiskProfile",
+    "FamilyCustomer",
+    "Tenure_MonthlyCharges",
+    "Tenure_ServiceCount",
+    "MonthlyCharges_ServiceCount",
+)
+
+# Raw column indices
+PARTNER = RAW_COLS.index("Partner")
+DEPENDENTS = RAW_COLS.index("Dependents")
+PHONE_SERVICE = RAW_COLS.index("PhoneService")
+INTERNET_SERVICE = RAW_COLS.index("InternetService")
+ONLINE_SECURITY = RAW_COLS.index("OnlineSecurity")
+ONLINE_BACKUP = RAW_COLS.index("OnlineBackup")
+DEVICE_PROTECTION = RAW_COLS.index("DeviceProtection")
+TECH_SUPPORT = RAW_COLS.index("TechSupport")
+STREAMING_TV = RAW_COLS.index("StreamingTV")
+STREAMING_MOVIES = RAW_COLS.index("StreamingMovies")
+CONTRACT = RAW_COLS.index("Contract")
+PAYMENT_METHOD = RAW_COLS.index("PaymentMethod")
+TENURE = RAW_COLS.index("tenure")
+MONTHLY_CHARGES = RAW_COLS.index("MonthlyCharges")
+TOTAL_CHARGES = RAW_COLS.index("TotalCharges")
+N_RAW = len(RAW_COLS)
+
+# pd.cut bins used for ValueSegment during training (right-closed intervals)
+VALUE_SEGMENT_BINS = (0.0, 35.0, 70.0, 120.0)
+VALUE_SEGMENT_LOW_MAX = VALUE_SEGMENT_BINS[1]
+VALUE_SEGMENT_MEDIUM_MAX = VALUE_SEGMENT_BINS[2]
+
+# Layout of the category code array passed to the kernels
+CODE_KEYS = (
+    ("PhoneService", "Yes"),
+    ("InternetService", "No"),
+    ("OnlineSecurity", "Yes"),  # all add-on services share the same codes
+    ("Partner", "Yes"),
+    ("Dependents", "Yes"),
+    ("Contract", "Month-to-month"),
+    ("PaymentMethod", "Electronic check"),
+    ("HasPremiumServices", "No"),  # all derived Yes/No flags share the same codes
+    ("HasPremiumServices", "Yes"),
+    ("ValueSegment", "Low Value"),  # segment codes in bin order
+    ("ValueSegment", "Medium Value"),
+    ("ValueSegment", "High Value"),
+)
+PHONE_YES, INTERNET_NO, SERVICE_YES, PARTNER_YES, DEPENDENTS_YES = range(5)
+MONTH_TO_MONTH, ELECTRONIC_CHECK, FLAG_NO, FLAG_YES = range(5, 9)
+SEGMENT_LOW, SEGMENT_MEDIUM, SEGMENT_HIGH = range(9, 12)
+
+
+@njit(cache=True, nogil=True)
+def engineer_row(raw, positions, codes, mean, inv_scale, out):
+    """Compute one row's engineered features and store the scaled row"""
+    yes = codes[SERVICE_YES]
+    premium = (
+        (raw[ONLINE_SECURITY] == yes)
+        + (raw[ONLINE_BACKUP] == yes)
+        + (raw[DEVICE_PROTECTION] == yes)
+        + (raw[TECH_SUPPORT] == yes)
+    )
+    streaming_tv = raw[STREAMING_TV] == yes
+    streaming_movies = raw[STREAMING_MOVIES] == yes
+    services = (
+        (raw[PHONE_SERVICE] == codes[PHONE_YES])
+        + (raw[INTERNET_SERVICE] != codes[INTERNET_NO])
+        + premium
+        + streaming_tv
+        + streaming_movies
+    )
+
+    tenure = raw[TENURE]
+    monthly = raw[MONTHLY_CHARGES]
+    flag_no = codes[FLAG_NO]
+    flag_yes = codes[FLAG_YES]
+
+    # Bin index as searchsorted(side="left") on the inner edges, which
+    # matches pd.cut's right-closed intervals; codes are laid out by bin
+    segment = codes[
+        SEGMENT_LOW
+        + (monthly > VALUE_SEGMENT_LOW_MAX)
+        + (monthly > VALUE_SEGMENT_MEDIUM_MAX)
+    ]
+
+    # In ENGINEERED_COLS order
+    engineered = (
+        float(services),
+        raw[TOTAL_CHARGES] / (tenure if tenure != 0 else 1.0),
+        float(premium),
+        flag_yes if premium > 0 else flag_no,
+        flag_yes if streaming_tv or streaming_movies else flag_no,
+        segment,
+        (
+            flag_yes
+            if raw[CONTRACT] == codes[MONTH_TO_MONTH]
+            and raw[PAYMENT_METHOD] == codes[ELECTRONIC_CHECK]
+            else flag_no
+        ),
+        (
+            flag_yes
+            if raw[PARTNER] == codes[PARTNER_YES]
+            or raw[DEPENDENTS] == codes[DEPENDENTS_YES]
+            else flag_no
+        ),
+        tenure * monthly,
+        tenure * services,
+        monthly * services,
+    )
+
+    # Standard scaling fused into the stores (values stay float64 until here)
+    for j in range(N_RAW):
+        k = positions[j]
+        out[k] = (raw[j] - mean[k]) * inv_scale[k]
+    for j in range(len(engineered)):
+        k = positions[N_RAW + j]
+        out[k] = (engineered[j] - mean[k]) * inv_scale[k]
+
+
+@njit(cache=True, nogil=True)
+def engineer_features(raw, positions, codes, mean, inv_scale, out):
+    """Compute the scaled feature matrix row by row"""
+    for i in range(raw.shape[0]):
+        engineer_row(raw[i], positions, codes, mean, inv_scale, out[i])
+
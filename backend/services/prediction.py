@@ -2,50 +2,50 @@
 Prediction service for churn prediction
 """
 
-from typing import List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+import numpy as np
 from models.request import CustomerData
-from models.response import PredictionResponse, BatchPredictionResponse
-from services.preprocessing import DataPreprocessor
+from models.response import PredictionResponse
+from services.preprocessing import preprocess, preprocess_many
+from services.cache import prediction_cache
 from core.model_loader import model_manager
-from core.config import RISK_THRESHOLD_LOW, RISK_THRESHOLD_MEDIUM
+from core.config import (
+    BATCH_THREADS,
+    CHURN_THRESHOLD,
+    MIN_PARALLEL,
+    RISK_THRESHOLD_LOW,
+    RISK_THRESHOLD_MEDIUM,
+    WARMUP_BATCH_SIZE,
+    WARMUP_RUNS,
+)
 
 
 class PredictionService:
     """Handle prediction logic"""
 
     def __init__(self):
-        self.preprocessor = DataPreprocessor()
+        # Threads are only started once a batch is large enough to shard
+        self._executor = ThreadPoolExecutor(
+            max_workers=BATCH_THREADS, thread_name_prefix="predict-batch"
+        )
 
     def predict_single(self, customer_data: CustomerData) -> PredictionResponse:
         """
         Predict churn for a single customer
 
+        Shares predict_many's cached, IoBinding-backed single-row path.
+
         Args:
             customer_data: Customer data from API request
 
         Returns:
             PredictionResponse with prediction results
         """
-        # Preprocess input
-        processed_data = self.preprocessor.preprocess(customer_data)
-
-        # Make prediction
-        prediction = model_manager.model.predict(processed_data)[0]
-        probability = model_manager.model.predict_proba(processed_data)[0][1]
+        return PredictionResponse(**self.predict_many([customer_data])[0])
 
-        # Determine risk level
-        risk_level = self._get_risk_level(probability)
-
-        return PredictionResponse(
-            churn_prediction=int(prediction),
-            churn_probability=float(probability),
-            churn_label="Churn" if prediction == 1 else "No Churn",
-            risk_level=risk_level,
-        )
-
-    def predict_batch(
-        self, customers: List[CustomerData]
-    ) -> BatchPredictionResponse:
+    def predict_batch(self, customers: List[CustomerData]) -> Dict[str, Any]:
         """
         Predict churn for multiple customers
 
@@ -53,43 +53,165 @@ class PredictionService:
             customers: List of customer data
 
         Returns:
-            BatchPredictionResponse with all predictions and statistics
+            Dict matching BatchPredictionResponse with all predictions and
+            statistics
         """
-        predictions = []
-
-        for customer in customers:
-            prediction = self.predict_single(customer)
-            predictions.append(prediction)
+        predictions = self.predict_many(customers)
 
         # Calculate statistics
         total_customers = len(predictions)
-        predicted_churners = sum(1 for p in predictions if p.churn_prediction == 1)
+        predicted_churners = sum(p["churn_prediction"] for p in predictions)
         churn_rate = predicted_churners / total_customers if total_customers > 0 else 0
 
-        return BatchPredictionResponse(
-            predictions=predictions,
-            total_customers=total_customers,
-            predicted_churners=predicted_churners,
-            churn_rate=round(churn_rate, 4),
-        )
+        return {
+            "predictions": predictions,
+            "total_customers": total_customers,
+            "predicted_churners": predicted_churners,
+            "churn_rate": round(churn_rate, 4),
+        }
+
+    def predict_many(self, customers: List[CustomerData]) -> List[Dict[str, Any]]:
+        """
+        Score a list of customers in one vectorized pass
+
+        Results are plain dicts with the PredictionResponse fields, ready for
+        ORJSONResponse; no pydantic models are built per row.
+
+        Args:
+            customers: List of customer data
+
+        Returns:
+            Prediction dict for each customer, in input order
+        """
+        if not customers:
+            return []
+
+        # Serve repeated customers from the cache; collect unique misses
+        keys = [customer.cache_key() for customer in customers]
+        cached = prediction_cache.get_many(keys)
+
+        probabilities = np.empty(len(customers), dtype=np.float64)
+        misses = {}
+        for i, (key, probability) in enumerate(zip(keys, cached)):
+            if probability is None:
+                misses.setdefault(key, []).append(i)
+            else:
+                probabilities[i] = probability
+
+        if misses:
+            # Preprocess and score the unique misses
+            unique_customers = [customers[rows[0]] for rows in misses.values()]
+            scored = self._score(unique_customers).tolist()
+
+            for rows, probability in zip(misses.values(), scored):
+                probabilities[rows] = probability
+            prediction_cache.put_many(zip(misses, scored))
+
+        churn_predictions = probabilities > CHURN_THRESHOLD
+        churn_labels = np.where(churn_predictions, "Churn", "No Churn")
+        risk_levels = self._get_risk_levels(probabilities)
+
+        return [
+            {
+                "churn_prediction": prediction,
+                "churn_probability": probability,
+                "churn_label": label,
+                "risk_level": risk_level,
+            }
+            for prediction, probability, label, risk_level in zip(
+                churn_predictions.astype(int).tolist(),
+                probabilities.tolist(),
+                churn_labels.tolist(),
+                risk_levels.tolist(),
+            )
+        ]
+
+    def _score(self, customers: List[CustomerData]) -> np.ndarray:
+        """
+        Preprocess and score customers, sharding large batches over threads
+
+        A lone customer is written into the model's preallocated input
+        buffer and scored through its IoBinding. Batches of at least
+        MIN_PARALLEL customers are split into shards of at least MIN_PARALLEL
+        rows, scored concurrently on the executor (the feature kernel and the
+        model runtime both release the GIL) and concatenated back in order.
+
+        Args:
+            customers: List of customer data
+
+        Returns:
+            Churn probability for each customer, in input order
+        """
+        if len(customers) == 1:
+            with model_manager.input_lock:
+                # Preprocess straight into the IoBinding-bound model input
+                preprocess(customers[0], out=model_manager.input_buffer)
+                return np.array([model_manager.predict_proba_one()])
+
+        n_shards = min(BATCH_THREADS, len(customers) // MIN_PARALLEL)
+        if n_shards <= 1:
+            return self._score_shard(customers)
+
+        bounds = np.linspace(0, len(customers), n_shards + 1).astype(int)
+        shards = [customers[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:])]
+        return np.concatenate(list(self._executor.map(self._score_shard, shards)))
 
     @staticmethod
-    def _get_risk_level(probability: float) -> str:
+    def _score_shard(customers: List[CustomerData]) -> np.ndarray:
+        """Preprocess customers and score them with one model run"""
+        return model_manager.predict_proba(preprocess_many(customers))
+
+    def warmup(self) -> Dict[str, float]:
+        """
+        Exercise the single and batch paths once before serving traffic
+
+        Triggers Numba kernel loading, ONNX Runtime's first-run setup and
+        allocator warmup so the first real requests don't pay for them.
+        Predictions are made on the schema example with the cache cleared,
+        so every call reaches the model; the cache is left empty afterwards.
+
+        Returns:
+            Timings in milliseconds for each warmup step
         """
-        Determine risk level based on probability
+        example_fields = CustomerData.model_config["json_schema_extra"]["example"]
+        example = CustomerData(**example_fields)
+        # Distinct customers so the batch isn't deduplicated to a single row
+        batch = [
+            example.model_copy(update={"tenure": example.tenure + i})
+            for i in range(WARMUP_BATCH_SIZE)
+        ]
+
+        timings = {}
+        for run in range(WARMUP_RUNS):
+            prediction_cache.clear()
+            start = time.perf_counter()
+            self.predict_single(example)
+            timings[f"single_{run + 1}"] = (time.perf_counter() - start) * 1000
+
+        prediction_cache.clear()
+        start = time.perf_counter()
+        self.predict_batch(batch)
+        timings[f"batch_{WARMUP_BATCH_SIZE}"] = (time.perf_counter() - start) * 1000
+
+        prediction_cache.clear()
+        return timings
+
+    @staticmethod
+    def _get_risk_levels(probabilities: np.ndarray) -> np.ndarray:
+        """
+        Vectorized risk level lookup for a batch of probabilities
 
         Args:
-            probability: Churn probability
+            probabilities: Array of churn probabilities
 
         Returns:
-            Risk level string (Low/Medium/High)
+            Array of risk level strings (Low/Medium/High)
         """
-        if probability < RISK_THRESHOLD_LOW:
-            return "Low"
-        elif probability < RISK_THRESHOLD_MEDIUM:
-            return "Medium"
-        else:
-            return "High"
+        return np.select(
+            [probabilities < RISK_THRESHOLD_LOW, probabilities < RISK_THRESHOLD_MEDIUM],
+            ["Low", "Medium"],
+            "High",
+        )
 
 
 # Create singleton instance
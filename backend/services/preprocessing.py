@@ -1,163 +1,152 @@
 """
 Data preprocessing and feature engineering
+
+Stateless functions; the artifacts they need are read from model_manager.
 """
 
-import pandas as pd
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import numpy as np
 from models.request import CustomerData
 from core.model_loader import model_manager
-
-
-class DataPreprocessor:
-    """Handle all data preprocessing and feature engineering"""
-
-    @staticmethod
-    def preprocess(customer_data: CustomerData) -> pd.DataFrame:
-        """
-        Preprocess input data to match training data format
-
-        Args:
-            customer_data: Customer data from API request
-
-        Returns:
-            Preprocessed and scaled DataFrame ready for prediction
-        """
-        # Convert to dictionary and create DataFrame
-        data = customer_data.dict()
-        df = pd.DataFrame([data])
-
-        # Apply feature engineering
-        df = DataPreprocessor._engineer_features(df)
-
-        # Encode categorical variables
-        df = DataPreprocessor._encode_features(df)
-
-        # Ensure correct feature order
-        df = df[model_manager.feature_names]
-
-        # Scale features
-        df_scaled = model_manager.scaler.transform(df)
-        df_scaled = pd.DataFrame(df_scaled, columns=model_manager.feature_names)
-
-        return df_scaled
-
-    @staticmethod
-    def _engineer_features(df: pd.DataFrame) -> pd.DataFrame:
-        """
-        Create engineered features matching the training process
-
-        Args:
-            df: Input DataFrame
-
-        Returns:
-            DataFrame with engineered features
-        """
-        # 1. Service Count
-        service_cols = [
-            "PhoneService",
-            "InternetService",
-            "OnlineSecurity",
+from services.kernels import (
+    CODE_KEYS,
+    ENGINEERED_COLS,
+    INPUT_CATEGORICAL_COLS,
+    RAW_COLS,
+    MONTHLY_CHARGES,
+    VALUE_SEGMENT_BINS,
+    engineer_features,
+)
+
+
+def preprocess(
+    customer_data: CustomerData, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Preprocess input data to match training data format
+
+    Args:
+        customer_data: Customer data from API request
+        out: Optional (1, n_features) float32 array to write into
+
+    Returns:
+        Scaled float32 feature row of shape (1, n_features)
+    """
+    raw = np.array([_raw_row(customer_data)], dtype=np.float64)
+    if out is None:
+        out = np.empty((1, len(model_manager.feature_names)), dtype=np.float32)
+    return _transform(raw, out)
+
+
+def preprocess_many(customers: List[CustomerData]) -> np.ndarray:
+    """
+    Preprocess a batch of customers into one feature matrix
+
+    Args:
+        customers: List of customer data from API request
+
+    Returns:
+        Scaled float32 feature matrix of shape (n_customers, n_features)
+    """
+    raw = np.array([_raw_row(customer) for customer in customers], dtype=np.float64)
+    out = np.empty(
+        (len(customers), len(model_manager.feature_names)), dtype=np.float32
+    )
+    return _transform(raw, out)
+
+
+def _raw_row(customer_data: CustomerData) -> List[float]:
+    """
+    Encode one customer's input fields in RAW_COLS order
+
+    Args:
+        customer_data: Customer data from API request
+
+    Returns:
+        Encoded categorical codes followed by the numeric fields
+    """
+    c = customer_data
+    encoders = model_manager.category_encoders
+
+    row = []
+    for col in INPUT_CATEGORICAL_COLS:
+        value = getattr(c, col)
+        try:
+            row.append(encoders[col](value))
+        except KeyError:
+            raise ValueError(f"Unknown value {value!r} for {col}") from None
+
+    row += (c.SeniorCitizen, c.tenure, c.MonthlyCharges, c.TotalCharges)
+    return row
+
+
+def _transform(raw: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Engineer and scale features with the Numba kernel
+
+    Args:
+        raw: Raw encoded matrix of shape (n_rows, len(RAW_COLS))
+        out: Output array of shape (n_rows, n_features)
+
+    Returns:
+        out, filled with scaled features in training feature order
+    """
+    monthly = raw[:, MONTHLY_CHARGES]
+    if (
+        (monthly <= VALUE_SEGMENT_BINS[0]) | (monthly > VALUE_SEGMENT_BINS[-1])
+    ).any():
+        raise ValueError("MonthlyCharges outside the range seen in training")
+
+    positions, codes = _kernel_tables()
+    engineer_features(
+        raw,
+        positions,
+        codes,
+        model_manager.scaler_mean,
+        model_manager.scaler_inv_scale,
+        out,
+    )
+    return out
+
+
+@lru_cache(maxsize=None)
+def _kernel_tables() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the lookup arrays the feature kernels need from the loaded artifacts
+
+    Returns:
+        Output position of each raw/engineered column, and the category
+        codes listed in CODE_KEYS
+    """
+    feature_index = {name: i for i, name in enumerate(model_manager.feature_names)}
+    positions = np.array(
+        [feature_index[name] for name in RAW_COLS + ENGINEERED_COLS], dtype=np.int64
+    )
+
+    encoders = model_manager.category_encoders
+    codes = np.array(
+        [encoders[col](value) for col, value in CODE_KEYS], dtype=np.float64
+    )
+
+    # The kernel reads one shared code for columns with identical classes
+    shared = {
+        "OnlineSecurity": (
             "OnlineBackup",
             "DeviceProtection",
             "TechSupport",
             "StreamingTV",
             "StreamingMovies",
-        ]
-
-        df["ServiceCount"] = 0
-        for col in service_cols:
-            if col == "PhoneService":
-                df["ServiceCount"] += (df[col] == "Yes").astype(int)
-            elif col == "InternetService":
-                df["ServiceCount"] += (df[col] != "No").astype(int)
-            else:
-                df["ServiceCount"] += (df[col] == "Yes").astype(int)
-
-        # 2. Average Monthly Rate
-        df["AvgMonthlyRate"] = df["TotalCharges"] / df["tenure"].replace(0, 1)
-
-        # 3. Premium Service Count
-        premium_services = [
-            "OnlineSecurity",
-            "OnlineBackup",
-            "DeviceProtection",
-            "TechSupport",
-        ]
-        df["PremiumServiceCount"] = sum(
-            [(df[col] == "Yes").astype(int) for col in premium_services]
-        )
-        df["HasPremiumServices"] = (df["PremiumServiceCount"] > 0).map(
-            {True: "Yes", False: "No"}
-        )
-
-        # 4. Has Streaming
-        df["HasStreaming"] = (
-            (df["StreamingTV"] == "Yes") | (df["StreamingMovies"] == "Yes")
-        ).map({True: "Yes", False: "No"})
-
-        # 5. Value Segment
-        df["ValueSegment"] = pd.cut(
-            df["MonthlyCharges"],
-            bins=[0, 35, 70, 120],
-            labels=["Low Value", "Medium Value", "High Value"],
-        )
-
-        # 6. High Risk Profile
-        df["HighRiskProfile"] = (
-            (df["Contract"] == "Month-to-month")
-            & (df["PaymentMethod"] == "Electronic check")
-        ).map({True: "Yes", False: "No"})
-
-        # 7. Family Customer
-        df["FamilyCustomer"] = (
-            (df["Partner"] == "Yes") | (df["Dependents"] == "Yes")
-        ).map({True: "Yes", False: "No"})
-
-        # 8. Interaction features
-        df["Tenure_MonthlyCharges"] = df["tenure"] * df["MonthlyCharges"]
-        df["Tenure_ServiceCount"] = df["tenure"] * df["ServiceCount"]
-        df["MonthlyCharges_ServiceCount"] = df["MonthlyCharges"] * df["ServiceCount"]
-
-        return df
-
-    @staticmethod
-    def _encode_features(df: pd.DataFrame) -> pd.DataFrame:
-        """
-        Encode categorical variables using saved label encoders
-
-        Args:
-            df: DataFrame with categorical features
-
-        Returns:
-            DataFrame with encoded categorical features
-        """
-        categorical_cols = [
-            "gender",
-            "Partner",
-            "Dependents",
-            "PhoneService",
-            "MultipleLines",
-            "InternetService",
-            "OnlineSecurity",
-            "OnlineBackup",
-            "DeviceProtection",
-            "TechSupport",
-            "StreamingTV",
-            "StreamingMovies",
-            "Contract",
-            "PaperlessBilling",
-            "PaymentMethod",
-            "HasPremiumServices",
-            "HasStreaming",
-            "HighRiskProfile",
-            "FamilyCustomer",
-            "ValueSegment",
-        ]
-
-        label_encoders = model_manager.label_encoders
-
-        for col in categorical_cols:
-            if col in df.columns and col in label_encoders:
-                df[col] = label_encoders[col].transform(df[col].astype(str))
-
-        return df
-
+        ),
+        "HasPremiumServices": ("HasStreaming", "HighRiskProfile", "FamilyCustomer"),
+    }
+    for reference, columns in shared.items():
+        for col in columns:
+            for value in ("No", "Yes"):
+                if encoders[col](value) != encoders[reference](value):
+                    raise RuntimeError(
+                        f"Label encoder for {col} differs from {reference}"
+                    )
+
+    return positions, codes